@@ -25,16 +25,41 @@ from __future__ import annotations
 
 import datetime
 import json
+import logging
 from pathlib import Path
 
 from airflow.decorators import task
 from airflow.models.dag import DAG
 from airflow.models.param import Param, ParamsDict
 
+log = logging.getLogger(__name__)
+
+try:
+    # orjson is not a dependency of Airflow but is used to render the params faster if it is installed
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_DAG_ID = Path(__file__).stem
+_SHORT_DESC = __doc__.split(".", 1)[0]
+_PICK_ONE_ENUM = tuple(f"value {i}" for i in range(16, 64))
+_PROPOSALS_EXAMPLES = tuple(
+    (
+        "Alpha,Bravo,Charlie,Delta,Echo,Foxtrot,Golf,Hotel,India,Juliett,Kilo,Lima,Mike,November,Oscar,Papa,"
+        "Quebec,Romeo,Sierra,Tango,Uniform,Victor,Whiskey,X-ray,Yankee,Zulu"
+    ).split(",")
+)
+# Note: "today" is evaluated once when the DAG file is parsed, so the date defaults of the trigger form
+# stay stable for the lifetime of the parsing process.
+_TODAY = datetime.date.today().isoformat()
+_NOON_1217 = "12:17:00"
+_T_121314 = "12:13:14"
+_DATETIME_DEFAULT = f"{_TODAY}T{_NOON_1217}+00:00"
+
 with DAG(
-    dag_id=Path(__file__).stem,
+    dag_id=_DAG_ID,
     dag_display_name="Params UI tutorial",
-    description=__doc__.partition(".")[0],
+    description=_SHORT_DESC,
     doc_md=__doc__,
     schedule=None,
     start_date=datetime.datetime(2022, 3, 4),
@@ -67,7 +92,7 @@ with DAG(
             type="string",
             title="Select one Value",
             description="You can use JSON schema enum's to generate drop down selection boxes.",
-            enum=[f"value {i}" for i in range(16, 64)],
+            enum=list(_PICK_ONE_ENUM),
         ),
         # You can also label the selected values via values_display attribute
         "pick_with_label": Param(
@@ -96,10 +121,7 @@ with DAG(
             title="Field with proposals",
             description="You can use JSON schema examples's to generate drop down selection boxes "
             "but allow also to enter custom values. Try typing an 'a' and see options.",
-            examples=(
-                "Alpha,Bravo,Charlie,Delta,Echo,Foxtrot,Golf,Hotel,India,Juliett,Kilo,Lima,Mike,November,Oscar,Papa,"
-                "Quebec,Romeo,Sierra,Tango,Uniform,Victor,Whiskey,X-ray,Yankee,Zulu"
-            ).split(","),
+            examples=list(_PROPOSALS_EXAMPLES),
         ),
         # If you want to select multiple items from a fixed list JSON schema des not allow to use enum
         # In this case the type "array" is being used together with "examples" as pick list
@@ -142,14 +164,14 @@ with DAG(
         ),
         # Dates and Times are also supported
         "date_time": Param(
-            f"{datetime.date.today()}T{datetime.time(hour=12, minute=17, second=00)}+00:00",
+            _DATETIME_DEFAULT,
             type="string",
             format="date-time",
             title="Date-Time Picker",
             description="Please select a date and time, use the button on the left for a pup-up calendar.",
         ),
         "date": Param(
-            f"{datetime.date.today()}",
+            _TODAY,
             type="string",
             format="date",
             title="Date Picker",
@@ -157,7 +179,7 @@ with DAG(
             "See that here are no times!",
         ),
         "time": Param(
-            f"{datetime.time(hour=12, minute=13, second=14)}",
+            _T_121314,
             type=["string", "null"],
             format="time",
             title="Time Picker",
@@ -241,6 +263,16 @@ with DAG(
     @task(task_display_name="Show used parameters")
     def show_params(**kwargs) -> None:
         params: ParamsDict = kwargs["params"]
-        print(f"This DAG was triggered with the following parameters:\n\n{json.dumps(params, indent=4)}\n")
+        if not params:
+            log.info("This DAG was triggered without parameters.")
+            return
+        # Only serialize the params if the message is going to be emitted
+        if not log.isEnabledFor(logging.INFO):
+            return
+        if orjson is not None:
+            params_json = orjson.dumps(dict(params), option=orjson.OPT_INDENT_2).decode()
+        else:
+            params_json = json.dumps(params, indent=4)
+        log.info("This DAG was triggered with the following parameters:\n\n%s\n", params_json)
 
     show_params()
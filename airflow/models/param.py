@@ -22,6 +22,7 @@ import datetime
 import json
 import logging
 import warnings
+import weakref
 from typing import TYPE_CHECKING, Any, ClassVar, ItemsView, Iterable, MutableMapping, ValuesView
 
 from pendulum.parsing import parse_iso8601
@@ -40,6 +41,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Compiled JSON schema validators per Param, so the schema itself is only checked once and not on every
+# resolve. Kept outside the instance to not leak into ``dump()``, copies or pickled Params.
+_VALIDATORS: weakref.WeakKeyDictionary[Param, Any] = weakref.WeakKeyDictionary()
+
 
 class Param:
     """
@@ -115,8 +120,6 @@ class Param:
         :param suppress_exception: To raise an exception or not when the validations fails.
             If true and validations fails, the return value would be None.
         """
-        import jsonschema
-        from jsonschema import FormatChecker
         from jsonschema.exceptions import ValidationError
 
         if value is not NOTSET:
@@ -127,7 +130,7 @@ class Param:
                 return None
             raise ParamValidationError("No value passed and Param has no default value")
         try:
-            jsonschema.validate(final_val, self.schema, format_checker=FormatChecker())
+            self._validate(final_val)
         except ValidationError as err:
             if err.schema.get("format") == "date-time":
                 rfc3339_value = self._warn_if_not_rfc3339_dt(final_val)
@@ -140,6 +143,22 @@ class Param:
         self.value = final_val
         return final_val
 
+    def _validate(self, value: Any) -> None:
+        """Validate the value like ``jsonschema.validate`` but reuse the compiled validator."""
+        from jsonschema import FormatChecker
+        from jsonschema.exceptions import best_match
+        from jsonschema.validators import validator_for
+
+        validator = _VALIDATORS.get(self)
+        if validator is None or validator.schema is not self.schema:
+            validator_cls = validator_for(self.schema)
+            validator_cls.check_schema(self.schema)
+            validator = validator_cls(self.schema, format_checker=FormatChecker())
+            _VALIDATORS[self] = validator
+        error = best_match(validator.iter_errors(value))
+        if error is not None:
+            raise error
+
     def dump(self) -> dict:
         """Dump the Param as a dictionary."""
         out_dict: dict[str, str | None] = {